@@ -20,35 +20,21 @@ st.set_page_config(
 )
 
 # Principal Architect Global Constants
-OPTIMIZATION_ALPHA = 0.1425  
-CONFIDENCE_LEVEL = 0.99      
 SYSTEM_VERSION = "16.0.4-SOVEREIGN"
-BASE_REVENUE = 150000000 
+AUDIT_PAGE_SIZE = 10
 LOGO_URL = "https://upload.wikimedia.org/wikipedia/commons/9/9d/Capgemini_2017_logo.svg"
 
 # =================================================================
 # 🧬 [2] THE SOVEREIGN KERNEL (QUANTITATIVE ENGINE)
 # =================================================================
-class SovereignKernel:
-    """The mathematical heart of the system."""
-    @staticmethod
-    def calculate_pareto_front(profits, sustainability):
-        points = np.vstack((profits, sustainability)).T
-        pareto_front = []
-        for i, p in enumerate(points):
-            if not any((points[:, 0] >= p[0]) & (points[:, 1] >= p[1]) & (np.arange(len(points)) != i)):
-                pareto_front.append(p)
-        return np.array(sorted(pareto_front, key=lambda x: x[0]))
-
-    @staticmethod
-    def compute_var(entropy_val, shock_factor=1.0):
-        mu = BASE_REVENUE
-        sigma = mu * entropy_val * shock_factor
-        return mu + (norm.ppf(1 - CONFIDENCE_LEVEL) * sigma)
-
-    @staticmethod
-    def generate_risk_matrix():
-        return np.random.randint(1, 10, size=(5, 5))
+# Kernel lives in src/ so the scoring service can share it without Streamlit
+from src.sovereign_kernel import (
+    SovereignKernel, OPTIMIZATION_ALPHA, BASE_REVENUE,
+    SCENARIO_WEIGHTS, ENTROPY_LEVELS
+)
+from src.dataset_cache import load_dataset, current_version
+from src.risk_map import build_map_points, MapConfig
+from src.audit_trail import get_audit_trail
 
 # =================================================================
 # 🛰️ [3] ROBUST BOOTSTRAP ENGINE (FIXED STATE INITIALIZATION)
@@ -60,18 +46,30 @@ def bootstrap_system():
         'is_optimized': False,
         'shock_factor': 1.0,
         'active_scenario': "Nominal Operations",
-        'logs': [f"[{datetime.now().strftime('%H:%M:%S')}] System Bootstrapped."],
         'drift_level': 0.0012,
         'last_rebalance': "N/A"
     }
     for key, value in initial_state.items():
         if key not in st.session_state:
             st.session_state[key] = value
+    # The audit session outlives "Purge Neural State" so the trail stays continuous
+    if 'audit_session' not in st.session_state:
+        st.session_state.audit_session = st.session_state.instance_id
+        log_event("System Bootstrapped.")
+
+def log_event(msg):
+    get_audit_trail().log(st.session_state.audit_session, msg)
 
 bootstrap_system()
 
-def log_event(msg):
-    st.session_state.logs.insert(0, f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+def load_processed_data():
+    """Read-only view over the shared dataset cache (one copy per host, not per session)."""
+    try:
+        return load_dataset()
+    except FileNotFoundError:
+        return None
+
+processed_data = load_processed_data()
 
 # =================================================================
 # 🎨 [4] THE "CAPGEMINI MIDNIGHT" DESIGN SYSTEM
@@ -104,7 +102,6 @@ st.markdown(f"""
     /* Sidebar Sophistication */
     [data-testid="stSidebar"] {{ background-color: #00050A; border-right: 1px solid #003087; }}
     
-    .audit-log {{ font-family: 'Courier New', monospace; font-size: 0.85rem; color: #00d4ff; }}
     .stress-alert {{
         background: rgba(255, 75, 75, 0.15); border: 1px solid #FF4B4B;
         padding: 15px; border-radius: 4px; margin: 10px 0px;
@@ -119,24 +116,25 @@ with st.sidebar:
     st.image("asserts/7cb5dfa2786c33a3411f252313aeefb3.jpg", width=180) # --- SIDEBAR LOGO ---
     st.markdown("### 🛰️ Operational Control")
     
-    scenario_options = ["Nominal Operations", "Suez Canal Blockade", "Tier-1 Cyber Attack", "Regional Conflict"]
+    scenario_options = list(SCENARIO_WEIGHTS)
     selected_scenario = st.selectbox("Trigger Stress Scenario", scenario_options)
     
-    scenario_weights = {"Nominal Operations": 1.0, "Suez Canal Blockade": 2.8, "Tier-1 Cyber Attack": 4.2, "Regional Conflict": 7.0}
-    
     if st.button("🚀 INJECT SYSTEMIC SHOCK"):
-        st.session_state.shock_factor = scenario_weights[selected_scenario]
+        st.session_state.shock_factor = SCENARIO_WEIGHTS[selected_scenario]
         st.session_state.active_scenario = selected_scenario
         st.session_state.is_optimized = False 
         log_event(f"SHOCK INJECTED: {selected_scenario}")
         st.rerun()
 
     st.divider()
-    entropy_choice = st.select_slider("Systemic Entropy", ["Stable", "Unstable", "Chaotic"])
-    e_val = {"Stable": 0.05, "Unstable": 0.15, "Chaotic": 0.40}[entropy_choice]
+    entropy_choice = st.select_slider("Systemic Entropy", list(ENTROPY_LEVELS))
+    e_val = ENTROPY_LEVELS[entropy_choice]
     
     if st.button("Purge Neural State"):
+        audit_session = st.session_state.audit_session
         st.session_state.clear()
+        st.session_state.audit_session = audit_session
+        log_event("Neural State Purged.")
         st.rerun()
 
 # =================================================================
@@ -148,7 +146,8 @@ with st.container():
     col_header, col_logo = st.columns([4, 1])
     with col_header:
         st.markdown("<h1 class='glitch-header'>NEURAL SOVEREIGNTY</h1>", unsafe_allow_html=True)
-        st.caption(f"Instance: {st.session_state.instance_id} | v{SYSTEM_VERSION} | Scenario: {st.session_state.active_scenario}")
+        st.caption(f"Instance: {st.session_state.instance_id} | v{SYSTEM_VERSION} | Scenario: {st.session_state.active_scenario}"
+                   + (f" | Dataset: {current_version()} ({len(processed_data):,} records)" if processed_data is not None else ""))
     with col_logo:
         st.image("asserts/7cb5dfa2786c33a3411f252313aeefb3.jpg", width=180) # --- TOP MAIN LOGO ---
 
@@ -183,12 +182,25 @@ with tab_risk:
     with c_map:
         st.markdown("#### Digital Twin Node Resilience")
         
-        map_df = pd.DataFrame({
-            'lat': [20, 30, 15, 25, 12], 'lon': [75, 70, 77, 85, 80],
-            'risk': [85, 45, 15, 95, 5] if st.session_state.shock_factor > 1 else [10, 5, 2, 8, 1]
-        })
+        col_zoom, col_focus = st.columns(2)
+        map_zoom = col_zoom.select_slider("Map Zoom", options=list(range(1, 9)), value=3)
+        map_focus = col_focus.selectbox("Map Focus", ["Network Centroid"] + list(MapConfig.NODE_COORDINATES))
+        # Server-side aggregation: only grid-binned points in view at this zoom reach the browser
+        map_points = build_map_points(processed_data, current_version(), map_zoom, st.session_state.shock_factor,
+                                      center=MapConfig.NODE_COORDINATES.get(map_focus))
+        if map_points is None:
+            map_center = None
+            map_df = pd.DataFrame({
+                'lat': [20, 30, 15, 25, 12], 'lon': [75, 70, 77, 85, 80],
+                'risk': [85, 45, 15, 95, 5] if st.session_state.shock_factor > 1 else [10, 5, 2, 8, 1]
+            })
+        else:
+            map_df, (center_lat, center_lon) = map_points
+            map_center = dict(lat=center_lat, lon=center_lon)
         fig_map = px.scatter_mapbox(map_df, lat="lat", lon="lon", size="risk", color="risk",
-                                    color_continuous_scale="Reds", zoom=3.2, height=450, mapbox_style="carto-darkmatter")
+                                    hover_data=[c for c in ('nodes', 'lead_time', 'risk_score') if c in map_df.columns],
+                                    color_continuous_scale="Reds", range_color=(0, 100), center=map_center,
+                                    zoom=map_zoom, height=450, mapbox_style="carto-darkmatter")
         fig_map.update_layout(margin=dict(l=0,r=0,t=0,b=0))
         st.plotly_chart(fig_map, use_container_width=True)
     
@@ -247,7 +259,14 @@ st.divider()
 col_l, col_r = st.columns(2)
 with col_l:
     st.markdown("#### 🧬 System Audit Trail")
-    st.markdown(f"<div class='audit-log'>{'<br>'.join(st.session_state.logs[:10])}</div>", unsafe_allow_html=True)
+    audit = get_audit_trail()
+    audit_total = audit.count(st.session_state.audit_session)
+    audit_pages = max(1, -(-audit_total // AUDIT_PAGE_SIZE))
+    audit_page = st.number_input("Audit Page", min_value=1, max_value=audit_pages, value=1, step=1)
+    audit_rows = audit.query(st.session_state.audit_session, page=int(audit_page), page_size=AUDIT_PAGE_SIZE)
+    st.dataframe(pd.DataFrame(audit_rows, columns=["Timestamp", "Event"]), hide_index=True, use_container_width=True)
+    st.caption(f"Page {audit_page} of {audit_pages} | {audit_total} events"
+               + (f" | ⚠️ {audit.dropped} dropped" if audit.dropped else ""))
 
 with col_r:
     st.markdown("#### 📥 Sovereign Strategic Brief")
@@ -0,0 +1,56 @@
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+
+from run_pipeline import SovereignDataFactory, AnalyticsKernel, ShardedAnalyticsKernel
+
+# =================================================================
+# 📈 SCALING BENCHMARK: SHARDED ANALYTICS KERNEL, 1..N CORES
+# =================================================================
+def build_telemetry(n_nodes):
+    factory = SovereignDataFactory()
+    factory.nodes = [f"Node_{i:05d}" for i in range(n_nodes)]
+    return factory.generate_node_telemetry()
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark for ShardedAnalyticsKernel.")
+    parser.add_argument('--nodes', type=int, default=2000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--backend', choices=['process', 'joblib', 'dask'], default='process')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    # Per-shard kernel logging would swamp the timings
+    logging.getLogger('run_pipeline').setLevel(logging.WARNING)
+
+    print(f"\n>>> [BENCHMARK] Generating telemetry for {args.nodes} nodes...")
+    raw_df = build_telemetry(args.nodes)
+    print(f">>> {len(raw_df):,} rows, backend={args.backend}")
+
+    start = time.perf_counter()
+    serial_df = AnalyticsKernel.apply_inventory_optimization(raw_df.copy())
+    serial_savings = AnalyticsKernel.calculate_ebitda_impact(serial_df)
+    serial_time = time.perf_counter() - start
+
+    worker_counts = sorted({1, *[2 ** i for i in range(1, 16) if 2 ** i < args.max_workers], args.max_workers})
+    print("=" * 64)
+    print(f"{'Workers':>8} {'Best (s)':>10} {'Speedup':>9} {'Efficiency':>11} {'Exact':>8}")
+    print(f"{'serial':>8} {serial_time:>10.3f} {1.0:>9.2f} {'-':>11} {'-':>8}")
+    for workers in worker_counts:
+        kernel = ShardedAnalyticsKernel(workers=workers, backend=args.backend)
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            processed_df, savings = kernel.run(raw_df)
+            timings.append(time.perf_counter() - start)
+        exact = (savings == serial_savings
+                 and np.array_equal(processed_df['optimized_stock'].to_numpy(), serial_df['optimized_stock'].to_numpy()))
+        best = min(timings)
+        print(f"{workers:>8} {best:>10.3f} {serial_time / best:>9.2f} {serial_time / best / workers:>10.0%} {str(exact):>8}")
+    print("=" * 64)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+import aiohttp
+
+from src.sovereign_kernel import SCENARIO_WEIGHTS, ENTROPY_LEVELS
+
+# =================================================================
+# 📈 LOAD GENERATOR FOR THE SCORING SERVICE (src/scoring_service.py)
+# =================================================================
+def build_payload(endpoint):
+    if endpoint == 'restock':
+        return '/predict/restock', {
+            'sales': round(random.uniform(100, 5000), 2),
+            'quantity': random.randint(1, 15),
+            'discount': random.choice([0, 0.1, 0.2, 0.3]),
+            'current_stock': random.randint(5, 100)
+        }
+    if endpoint == 'var':
+        return '/risk/var', {
+            'entropy_level': random.choice(list(ENTROPY_LEVELS)),
+            'scenario': random.choice(list(SCENARIO_WEIGHTS))
+        }
+    return '/risk/stress', {'entropy_level': random.choice(list(ENTROPY_LEVELS))}
+
+async def worker(session, base_url, endpoint, n_requests, latencies, errors):
+    for _ in range(n_requests):
+        path, payload = build_payload(endpoint)
+        start = time.perf_counter()
+        try:
+            async with session.post(base_url + path, json=payload) as resp:
+                await resp.read()
+                if resp.status != 200:
+                    errors.append(resp.status)
+                    continue
+        except aiohttp.ClientError as e:
+            errors.append(str(e))
+            continue
+        latencies.append(time.perf_counter() - start)
+
+async def run_load_test(base_url, endpoint, total_requests, concurrency):
+    latencies, errors = [], []
+    per_worker = [total_requests // concurrency + (1 if i < total_requests % concurrency else 0) for i in range(concurrency)]
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(session, base_url, endpoint, n, latencies, errors) for n in per_worker))
+        elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Sovereign scoring service.")
+    parser.add_argument('--url', default='http://127.0.0.1:8080')
+    parser.add_argument('--endpoint', choices=['restock', 'var', 'stress'], default='restock')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"\n>>> [LOAD TEST] {args.requests} x /{args.endpoint} @ concurrency {args.concurrency}")
+    latencies, errors, elapsed = asyncio.run(
+        run_load_test(args.url, args.endpoint, args.requests, max(1, args.concurrency))
+    )
+
+    print("=" * 40)
+    if latencies:
+        ms = np.array(latencies) * 1000
+        print(f"Successful:   {len(latencies)}")
+        print(f"p50 Latency:  {np.percentile(ms, 50):.2f} ms")
+        print(f"p99 Latency:  {np.percentile(ms, 99):.2f} ms")
+        print(f"Throughput:   {len(latencies) / elapsed:,.1f} req/s ({len(latencies) / elapsed * 60:,.0f} req/min)")
+    print(f"Errors:       {len(errors)}")
+    print("=" * 40)
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,12 @@ import time
 import json
 import logging
 import uuid
+from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from scipy.stats import norm
+from src.dataset_cache import publish_dataset
+from src.risk_map import node_coordinates
 
 # =================================================================
 # 🛡️ [1] SYSTEM CONFIGURATION & LOGGING
@@ -22,7 +26,11 @@ class PipelineConfig:
     OUTPUT_FILE = os.path.join(DATA_DIR, "processed_data.csv")
     SUMMARY_FILE = os.path.join(DATA_DIR, "pipeline_summary.json")
     SIM_DAYS = 365
+    NODE_COUNT = int(os.getenv("PIPELINE_NODES", 7))           # >7 adds satellite nodes around the hubs
     BASE_GMV = 150000000 # $150M Institutional Baseline
+    WORKERS = int(os.getenv("PIPELINE_WORKERS", 1))          # >1 enables sharded execution
+    BACKEND = os.getenv("PIPELINE_BACKEND", "process")       # process | joblib | dask
+    SHARD_KEY = os.getenv("PIPELINE_SHARD_KEY", "node_id")
 
 # =================================================================
 # 🧠 [2] STOCHASTIC DATA ENGINE
@@ -35,6 +43,9 @@ class SovereignDataFactory:
             "Port_Mumbai", "Delhi_Hub", "Singapore_Node", "Suez_Transit", 
             "Rotterdam_Terminal", "Shanghai_Export", "Dubai_Logistics"
         ]
+        hubs = list(self.nodes)
+        for i in range(max(0, PipelineConfig.NODE_COUNT - len(hubs))):
+            self.nodes.append(f"{hubs[i % len(hubs)]}_Sat_{i // len(hubs):04d}")
 
     def simulate_gbm_path(self, s0, mu, sigma, steps):
         """Geometric Brownian Motion for realistic market volatility."""
@@ -46,7 +57,8 @@ class SovereignDataFactory:
         logger.info("🚀 [EXECUTING] Simulating Global Retail Market Data...")
         
         master_data = []
-        for node in self.nodes:
+        lats, lons = node_coordinates(self.nodes)
+        for node, lat, lon in zip(self.nodes, lats, lons):
             # Sales with GBM volatility
             sales_path = self.simulate_gbm_path(PipelineConfig.BASE_GMV / len(self.nodes), 0.05, 0.2, PipelineConfig.SIM_DAYS)
             
@@ -59,6 +71,8 @@ class SovereignDataFactory:
             df = pd.DataFrame({
                 'timestamp': dates,
                 'node_id': node,
+                'lat': lat,
+                'lon': lon,
                 'sales': sales_path,
                 'lead_time': lead_times,
                 'esg_compliance': esg_scores,
@@ -78,17 +92,126 @@ class AnalyticsKernel:
         logger.info("🚀 [EXECUTING] Executing Dynamic Inventory Optimization...")
         # Simulating Lead Time Optimization logic
         df['optimized_stock'] = df['sales'] * (df['lead_time'] / 14) * 1.15
-        time.sleep(1) 
         return df
 
     @staticmethod
     def calculate_ebitda_impact(df):
         logger.info("🚀 [EXECUTING] Calculating Projected EBITDA Impact...")
-        total_sales = df['sales'].sum()
+        # Exact total, so serial and sharded runs report bit-identical savings
+        return AnalyticsKernel.ebitda_from_sales(
+            AnalyticsKernel.combine_partial_sums([AnalyticsKernel.exact_partial_sum(df['sales'])])
+        )
+
+    @staticmethod
+    def exact_partial_sum(values):
+        """
+        Exact sum of a float column as (integer, exponent), i.e. integer * 2**exponent.
+        Vectorized: values are split into integer mantissas and binary exponents,
+        mantissas are summed per exponent in int64 and only the per-exponent
+        totals (at most ~2,100) are combined with Python's unbounded ints.
+        Non-finite input returns (float total, None).
+        """
+        x = np.asarray(values, dtype=np.float64)
+        if len(x) == 0:
+            return 0, 0
+        if not np.isfinite(x).all():
+            return float(x.sum()), None
+        mantissa, exponent = np.frexp(x)
+        ints = (mantissa * 2.0 ** 53).astype(np.int64)
+        # 27-bit halves keep the per-exponent int64 sums overflow-free up to ~2**36 rows
+        hi = ints >> 26
+        lo = ints - (hi << 26)
+        exponent = exponent.astype(np.int64) - 53
+        e_min = int(exponent.min())
+        offset = exponent - e_min
+        hi_sums = np.zeros(int(offset.max()) + 1, dtype=np.int64)
+        lo_sums = np.zeros_like(hi_sums)
+        np.add.at(hi_sums, offset, hi)
+        np.add.at(lo_sums, offset, lo)
+        total = 0
+        for i in map(int, np.flatnonzero(hi_sums | lo_sums)):
+            total += (int(hi_sums[i]) << (i + 26)) + (int(lo_sums[i]) << i)
+        return total, e_min
+
+    @staticmethod
+    def combine_partial_sums(partials):
+        """Correctly rounded float of the summed exact partials (equal to math.fsum)."""
+        non_finite = [total for total, exponent in partials if exponent is None]
+        if non_finite:
+            return float(sum(non_finite))
+        e_min = min(exponent for _, exponent in partials)
+        total = sum(value << (exponent - e_min) for value, exponent in partials)
+        return float(Fraction(total) * Fraction(2) ** e_min)
+
+    @staticmethod
+    def ebitda_from_sales(total_sales):
         # Heuristic: Optimization reduces carrying costs by 12%
         carrying_cost_saved = (total_sales * 0.02) * 0.12
         return carrying_cost_saved
 
+def _run_kernel_shard(shard):
+    """Worker entry point: (optimized shard, exact partial sum of its sales)."""
+    shard = AnalyticsKernel.apply_inventory_optimization(shard)
+    return shard, AnalyticsKernel.exact_partial_sum(shard['sales'])
+
+class ShardedAnalyticsKernel:
+    """
+    Data-parallel AnalyticsKernel. Partitions telemetry by a stable hash of
+    SHARD_KEY, runs the kernel on each shard in a worker pool and merges the
+    shards back into the original row order, so the output matches the
+    single-process kernel row for row. Each shard also returns the exact
+    (unrounded) sum of its sales; the parent combines those and rounds once,
+    so EBITDA is bit-identical to the serial kernel. Summing per-shard float
+    totals would round twice and can differ in the last bit.
+    """
+
+    def __init__(self, workers=PipelineConfig.WORKERS, backend=PipelineConfig.BACKEND, shard_key=PipelineConfig.SHARD_KEY):
+        self.workers = max(1, int(workers))
+        self.backend = backend
+        self.shard_key = shard_key
+
+    def partition(self, df):
+        # pandas' hash is stable across processes (unlike built-in hash())
+        keys = pd.util.hash_array(df[self.shard_key].astype(str).to_numpy())
+        shard_ids = keys % np.uint64(self.workers)
+        positions = [np.flatnonzero(shard_ids == i) for i in range(self.workers)]
+        positions = [p for p in positions if len(p)]
+        return [df.iloc[p] for p in positions], positions
+
+    def _map(self, shards):
+        if self.workers == 1 or len(shards) == 1:
+            return [_run_kernel_shard(s) for s in shards]
+        if self.backend == "process":
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                return list(pool.map(_run_kernel_shard, shards))
+        if self.backend == "joblib":
+            try:
+                from joblib import Parallel, delayed
+            except ImportError:
+                raise ImportError("PIPELINE_BACKEND=joblib requires joblib (pip install joblib).")
+            return Parallel(n_jobs=self.workers)(delayed(_run_kernel_shard)(s) for s in shards)
+        if self.backend == "dask":
+            try:
+                import dask
+            except ImportError:
+                raise ImportError("PIPELINE_BACKEND=dask requires dask (pip install dask).")
+            tasks = [dask.delayed(_run_kernel_shard)(s) for s in shards]
+            return list(dask.compute(*tasks, scheduler="processes", num_workers=self.workers))
+        raise ValueError(f"Unknown backend '{self.backend}'. Expected process, joblib or dask.")
+
+    def run(self, df):
+        """Returns (processed_df, ebitda_savings) equivalent to the serial kernel."""
+        logger.info(f"🚀 [EXECUTING] Sharded kernel: {self.workers} workers, backend={self.backend}, key={self.shard_key}")
+        shards, positions = self.partition(df)
+        results = self._map(shards)
+
+        merged = pd.concat([shard for shard, _ in results])
+        order = np.argsort(np.concatenate(positions), kind="stable")
+        processed_df = merged.iloc[order]
+        total_sales = AnalyticsKernel.combine_partial_sums([partial for _, partial in results])
+        savings = AnalyticsKernel.ebitda_from_sales(total_sales)
+        return processed_df, savings
+
 # =================================================================
 # 🚀 [4] PIPELINE ORCHESTRATION
 # =================================================================
@@ -108,11 +231,15 @@ def main():
     # B. Simulation & ML Data Prep
     raw_df = factory.generate_node_telemetry()
     
-    # C. Data Engine Transformations
-    processed_df = kernel.apply_inventory_optimization(raw_df)
-    
-    # D. Financial Impact Analysis
-    savings = kernel.calculate_ebitda_impact(processed_df)
+    if PipelineConfig.WORKERS > 1:
+        # C+D. Sharded Transformations & Financial Impact Analysis
+        processed_df, savings = ShardedAnalyticsKernel().run(raw_df)
+    else:
+        # C. Data Engine Transformations
+        processed_df = kernel.apply_inventory_optimization(raw_df)
+        
+        # D. Financial Impact Analysis
+        savings = kernel.calculate_ebitda_impact(processed_df)
     
     # E. Model "Training" (Metadata generation)
     logger.info("🚀 [EXECUTING] Training Predictive Risk Engine...")
@@ -126,6 +253,8 @@ def main():
 
     # G. Finalize
     processed_df.to_csv(PipelineConfig.OUTPUT_FILE, index=False)
+    # Publish to the shared-memory cache; attached readers switch to this version
+    publish_dataset(processed_df, PipelineConfig.OUTPUT_FILE)
     
     summary = {
         "pipeline_id": str(uuid.uuid4())[:12].upper(),
@@ -144,4 +273,4 @@ def main():
     print("############################################################")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,5 +1,10 @@
 import pandas as pd
 import os
+import sys
+
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.dataset_cache import load_dataset
 
 def run_consultant():
     print("\n🤖 Capgemini Virtual Consultant is Online.")
@@ -8,7 +13,7 @@ def run_consultant():
         print("❌ Error: processed_data.csv not found.")
         return
 
-    df = pd.read_csv('data/processed_data.csv')
+    df = load_dataset()
     
     # --- SIMULATING THE AI AGENT'S THOUGHT PROCESS ---
     print("\n> Entering new AgentExecutor chain...")
@@ -31,4 +36,4 @@ def run_consultant():
     print("-" * 50)
 
 if __name__ == "__main__":
-    run_consultant()
\ No newline at end of file
+    run_consultant()
\ No newline at end of file
@@ -0,0 +1,161 @@
+import os
+import sys
+import atexit
+import sqlite3
+import threading
+from collections import deque
+from datetime import datetime
+
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.utils import setup_custom_logger
+
+logger = setup_custom_logger("AuditTrail")
+
+class AuditConfig:
+    DB_FILE = os.path.join("logs", "audit_trail.db")
+    RING_SIZE = int(os.getenv("AUDIT_RING_SIZE", 1000))          # Max unflushed events held in memory
+    BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", 100))         # Wake the writer early at this backlog
+    FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", 0.5))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audit_session ON audit_events (session_id, id);
+"""
+
+class AuditTrail:
+    """
+    Write-behind audit log. `log()` is an O(1) append to a bounded in-memory
+    ring buffer; a background thread flushes it to SQLite in batches. Queries
+    are paginated newest-first and see both flushed and still-pending events.
+
+    `_lock` guards the ring and the in-flight batch and is never held during
+    disk I/O; `_db_lock` guards the connection and serializes flushes. A
+    full ring makes `log()` flush synchronously instead of evicting, so
+    `dropped` only counts events lost to a failed SQLite write.
+    """
+
+    def __init__(self, db_path=AuditConfig.DB_FILE, ring_size=AuditConfig.RING_SIZE,
+                 batch_size=AuditConfig.BATCH_SIZE, flush_interval=AuditConfig.FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._ring = deque(maxlen=ring_size)
+        self._inflight = []
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # One shared connection; every access goes through self._db_lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._writer = threading.Thread(target=self._run, name="AuditTrailWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    # =================================================================
+    # ✍️ WRITE PATH
+    # =================================================================
+    def log(self, session_id, message):
+        event = (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), session_id, message)
+        while True:
+            with self._lock:
+                # Check and append under one acquisition so deque(maxlen) never evicts
+                if len(self._ring) < self._ring.maxlen:
+                    self._ring.append(event)
+                    backlog = len(self._ring)
+                    break
+            # Writer has fallen behind: flush synchronously (blocks on _db_lock), then re-check
+            self.flush()
+        if backlog >= self.batch_size:
+            self._wake.set()
+
+    def flush(self):
+        with self._db_lock:
+            with self._lock:
+                if not self._ring:
+                    return
+                # Swap the ring out; the batch stays visible to queries while in flight
+                self._inflight = list(self._ring)
+                self._ring.clear()
+            try:
+                self._conn.executemany(
+                    "INSERT INTO audit_events (ts, session_id, message) VALUES (?, ?, ?)", self._inflight
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                with self._lock:
+                    self.dropped += len(self._inflight)
+                logger.error(f"Audit flush failed, {len(self._inflight)} events lost: {e}")
+            finally:
+                with self._lock:
+                    self._inflight = []
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._wake.set()
+        self._writer.join(timeout=5)
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+    # =================================================================
+    # 🔎 READ PATH (indexed, paginated)
+    # =================================================================
+    def _pending(self, session_id):
+        # Caller holds _db_lock, so no batch can be committed mid-read
+        with self._lock:
+            events = self._inflight + list(self._ring)
+        return [(e[0], e[2]) for e in reversed(events) if e[1] == session_id]
+
+    def count(self, session_id):
+        with self._db_lock:
+            pending = len(self._pending(session_id))
+            stored = self._conn.execute(
+                "SELECT COUNT(*) FROM audit_events WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+        return pending + stored
+
+    def query(self, session_id, page=1, page_size=10):
+        """Returns [(timestamp, message), ...] for one page, newest first."""
+        offset = (max(1, page) - 1) * page_size
+        with self._db_lock:
+            # Pending events are always newer than anything already flushed
+            pending = self._pending(session_id)
+            rows = pending[offset:offset + page_size]
+            remaining = page_size - len(rows)
+            if remaining > 0:
+                rows += self._conn.execute(
+                    "SELECT ts, message FROM audit_events WHERE session_id = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+                    (session_id, remaining, max(0, offset - len(pending)))
+                ).fetchall()
+        return rows
+
+# One writer thread and connection per server process, shared by all sessions
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
+def get_audit_trail():
+    global _INSTANCE
+    with _INSTANCE_LOCK:
+        if _INSTANCE is None:
+            _INSTANCE = AuditTrail()
+        return _INSTANCE
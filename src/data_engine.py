@@ -6,6 +6,7 @@ import sys
 # Ensure utility modules are discoverable
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.utils import setup_custom_logger
+from src.dataset_cache import publish_dataset
 
 # Initialize Professional Logger
 logger = setup_custom_logger("DataEngine")
@@ -67,6 +68,7 @@ def run_etl_pipeline():
     try:
         os.makedirs('data', exist_ok=True)
         df.to_csv(output_path, index=False)
+        publish_dataset(df, output_path)
         logger.info(f"Transformation successful. File saved to {output_path}")
         print(f"✅ SUCCESS: {len(df)} records optimized for AI analysis.")
     except Exception as e:
@@ -74,4 +76,4 @@ def run_etl_pipeline():
         print(f"❌ Failed to save processed data: {e}")
 
 if __name__ == "__main__":
-    run_etl_pipeline()
\ No newline at end of file
+    run_etl_pipeline()
\ No newline at end of file
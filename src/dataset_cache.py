@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import hashlib
+import shutil
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.utils import setup_custom_logger
+
+logger = setup_custom_logger("DatasetCache")
+
+class CacheConfig:
+    SOURCE_FILE = os.path.join("data", "processed_data.csv")
+    CACHE_DIR = os.path.join("data", "cache")
+    CURRENT_FILE = "CURRENT"
+    MANIFEST = "manifest.json"
+    # Text columns with more distinct values than this share of rows (ids, free text)
+    # gain nothing from a dictionary and are stored as fixed-width strings instead
+    MAX_CATEGORY_RATIO = 0.5
+
+# Attached versions ({cache root: (version, columns)}) are shared by every
+# Streamlit session / thread in this process
+_ATTACHED = {}
+_LOCK = threading.Lock()
+
+# =================================================================
+# 📦 PUBLISH (one writer, once per dataset version)
+# =================================================================
+def _cache_root(source_path):
+    # Each source file gets its own namespace so different datasets never evict each other
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    digest = hashlib.md5(os.path.abspath(source_path).encode()).hexdigest()[:8]
+    return os.path.join(CacheConfig.CACHE_DIR, f"{name}-{digest}")
+
+def _source_version(source_path):
+    stat = os.stat(source_path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+def publish_dataset(df, source_path=CacheConfig.SOURCE_FILE):
+    """
+    Writes each column of `df` as a memory-mappable .npy file and flips the
+    CURRENT pointer to the new version. Numeric/datetime columns are stored
+    as-is. Low-cardinality text is dictionary-encoded (integer codes +
+    categories, missing values kept as code -1); high-cardinality text is
+    stored as a fixed-width unicode array plus a null mask when needed.
+    """
+    version = _source_version(source_path) if os.path.exists(source_path) else uuid.uuid4().hex[:12]
+    root = _cache_root(source_path)
+    target_dir = os.path.join(root, version)
+
+    if not os.path.exists(target_dir):
+        staging_dir = os.path.join(root, f".staging-{uuid.uuid4().hex[:8]}")
+        os.makedirs(staging_dir)
+        manifest = {'version': version, 'source': source_path, 'rows': len(df), 'columns': []}
+
+        for i, col in enumerate(df.columns):
+            series = df[col]
+            entry = {'name': col, 'file': f"col_{i}.npy"}
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+                entry['kind'] = 'array'
+                np.save(os.path.join(staging_dir, entry['file']), series.to_numpy())
+            elif series.nunique() > CacheConfig.MAX_CATEGORY_RATIO * len(series):
+                entry['kind'] = 'string'
+                np.save(os.path.join(staging_dir, entry['file']), np.asarray(series.fillna(''), dtype=str))
+                if series.isna().any():
+                    entry['mask_file'] = f"col_{i}_mask.npy"
+                    np.save(os.path.join(staging_dir, entry['mask_file']), series.isna().to_numpy())
+            else:
+                entry['kind'] = 'categorical'
+                entry['categories_file'] = f"col_{i}_categories.npy"
+                cat = pd.Categorical(series)
+                np.save(os.path.join(staging_dir, entry['file']), cat.codes)
+                np.save(os.path.join(staging_dir, entry['categories_file']), np.asarray(cat.categories, dtype=str))
+            manifest['columns'].append(entry)
+
+        with open(os.path.join(staging_dir, CacheConfig.MANIFEST), 'w') as f:
+            json.dump(manifest, f, indent=4)
+
+        try:
+            os.rename(staging_dir, target_dir)
+        except OSError:
+            # Another process published the same version first
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    # Atomic pointer swap invalidates every older version
+    current_file = os.path.join(root, CacheConfig.CURRENT_FILE)
+    tmp_pointer = f"{current_file}.{uuid.uuid4().hex[:8]}"
+    with open(tmp_pointer, 'w') as f:
+        f.write(version)
+    os.replace(tmp_pointer, current_file)
+    logger.info(f"Published dataset version {version} ({len(df)} rows, {len(df.columns)} columns).")
+
+    _prune_old_versions(root, version)
+    return version
+
+def _prune_old_versions(root, keep):
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if name != keep and os.path.isdir(path) and not name.startswith('.staging-'):
+            # Readers that still map the old files keep working on POSIX;
+            # on Windows the delete is retried on the next publish.
+            shutil.rmtree(path, ignore_errors=True)
+
+# =================================================================
+# 🔗 ATTACH (read-only, zero-copy)
+# =================================================================
+def current_version(source_path=CacheConfig.SOURCE_FILE):
+    current_file = os.path.join(_cache_root(source_path), CacheConfig.CURRENT_FILE)
+    if not os.path.exists(current_file):
+        return None
+    with open(current_file) as f:
+        return f.read().strip() or None
+
+def _is_stale(version, source_path):
+    if version is None:
+        return True
+    if not os.path.exists(source_path):
+        return False
+    return version != _source_version(source_path)
+
+def _attach_version(root, version):
+    version_dir = os.path.join(root, version)
+    with open(os.path.join(version_dir, CacheConfig.MANIFEST)) as f:
+        manifest = json.load(f)
+
+    columns = {}
+    for entry in manifest['columns']:
+        codes = np.load(os.path.join(version_dir, entry['file']), mmap_mode='r')
+        if entry['kind'] == 'array':
+            columns[entry['name']] = codes
+        elif entry['kind'] == 'string':
+            if 'mask_file' in entry:
+                mask = np.load(os.path.join(version_dir, entry['mask_file']), mmap_mode='r')
+                codes = np.ma.MaskedArray(codes, mask=mask)
+            columns[entry['name']] = codes
+        else:
+            # Only the small category dictionary is loaded per process
+            categories = np.load(os.path.join(version_dir, entry['categories_file']))
+            column = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories))
+            if not np.shares_memory(column.codes, codes):
+                logger.warning(f"pandas {pd.__version__} copied the codes of '{entry['name']}'; column is not zero-copy.")
+            columns[entry['name']] = column
+    return columns
+
+def _read_source(source_path):
+    # Match the schema of a pipeline publish: ISO date columns become datetime64, not text
+    df = pd.read_csv(source_path)
+    for col in df.columns:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            try:
+                df[col] = pd.to_datetime(df[col], format='ISO8601')
+            except (ValueError, TypeError):
+                pass
+    return df
+
+def attach_columns(source_path=CacheConfig.SOURCE_FILE):
+    """
+    Returns {column: read-only array} for the current dataset version,
+    republishing from `source_path` first if the pipeline wrote a newer file.
+    """
+    version = current_version(source_path)
+    if _is_stale(version, source_path):
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"{source_path} missing. Run run_pipeline.py first.")
+        version = publish_dataset(_read_source(source_path), source_path)
+
+    root = _cache_root(source_path)
+    with _LOCK:
+        attached_version, columns = _ATTACHED.get(root, (None, None))
+        if attached_version != version:
+            try:
+                columns = _attach_version(root, version)
+            except FileNotFoundError:
+                # A concurrent publish pruned this version; follow the new pointer
+                version = current_version(source_path)
+                columns = _attach_version(root, version)
+            _ATTACHED[root] = (version, columns)
+            logger.info(f"Attached dataset version {version} (memory-mapped, read-only).")
+        return columns
+
+def load_dataset(source_path=CacheConfig.SOURCE_FILE):
+    """
+    DataFrame view over the shared columns. Existing columns are read-only:
+    adding new columns is fine, in-place edits need an explicit .copy().
+    pandas converts fixed-width string columns on construction; use
+    attach_columns() where those must stay memory-mapped.
+    """
+    return pd.DataFrame(attach_columns(source_path), copy=False)
+
+if __name__ == "__main__":
+    df = load_dataset()
+    print(f"✅ Dataset cache version {current_version()}: {len(df)} rows attached from {_cache_root(CacheConfig.SOURCE_FILE)}")
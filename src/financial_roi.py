@@ -1,7 +1,13 @@
 import pandas as pd
+import os
+import sys
+
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.dataset_cache import load_dataset
 
 def generate_consulting_report():
-    df = pd.read_csv('data/processed_data.csv')
+    df = load_dataset()
     
     # ADVANCED METRICS
     inventory_value = (df['quantity'] * 150).sum() # Assuming $150 avg unit value
@@ -19,4 +25,4 @@ def generate_consulting_report():
     print("="*40)
 
 if __name__ == "__main__":
-    generate_consulting_report()
\ No newline at end of file
+    generate_consulting_report()
\ No newline at end of file
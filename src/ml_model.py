@@ -1,14 +1,23 @@
 import pandas as pd
+import os
+import sys
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score
 
-def train_restock_predictor():
-    df = pd.read_csv('data/processed_data.csv')
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.dataset_cache import load_dataset
+
+# Features: Sales, Quantity, Discount, and Current Stock
+FEATURES = ['sales', 'quantity', 'discount', 'current_stock']
+
+def train_restock_predictor(df=None):
+    if df is None:
+        df = load_dataset()
     
-    # Features: Sales, Quantity, Discount, and Current Stock
-    X = df[['sales', 'quantity', 'discount', 'current_stock']]
-    y = df['restock_needed'].apply(lambda x: 1 if x == 'Yes' else 0)
+    X = df[FEATURES]
+    y = (df['restock_needed'] == 'Yes').astype(int)
     
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2)
     
@@ -19,5 +28,15 @@ def train_restock_predictor():
     print(f"🤖 Model Accuracy: {accuracy_score(y_test, predictions) * 100:.2f}%")
     return model
 
+def score_restock_batch(model, records):
+    """Vectorized scoring: one predict_proba call for a whole batch of records."""
+    X = pd.DataFrame.from_records(records, columns=FEATURES).astype(float)
+    classes = list(model.classes_)
+    proba = model.predict_proba(X)[:, classes.index(1)] if 1 in classes else [0.0] * len(X)
+    return [
+        {'restock_needed': 'Yes' if p >= 0.5 else 'No', 'probability': round(float(p), 4)}
+        for p in proba
+    ]
+
 if __name__ == "__main__":
-    train_restock_predictor()
\ No newline at end of file
+    train_restock_predictor()
\ No newline at end of file
@@ -0,0 +1,195 @@
+import os
+import sys
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.utils import setup_custom_logger
+
+logger = setup_custom_logger("RiskMap")
+
+class MapConfig:
+    MAX_POINTS = 1500          # Hard ceiling on markers sent to the browser
+    CELLS_PER_TILE = 4         # Grid cells per 256px map tile edge
+    VIEWPORT_TILES = (6, 4)    # (lon, lat) tiles kept around the map centre
+    BASELINE_LEAD_TIME = 14.0  # Days; matches run_pipeline's Poisson mean
+    NOMINAL_RISK = 10.0        # Risk index of a node running at baseline lead time
+    SATELLITE_SPREAD = 4.0     # Degrees; spread of non-hub nodes around their hub
+    # Anchor coordinates for the named hub nodes produced by run_pipeline.py
+    NODE_COORDINATES = {
+        "Port_Mumbai": (18.95, 72.84),
+        "Delhi_Hub": (28.61, 77.21),
+        "Singapore_Node": (1.26, 103.84),
+        "Suez_Transit": (30.58, 32.27),
+        "Rotterdam_Terminal": (51.95, 4.14),
+        "Shanghai_Export": (31.23, 121.47),
+        "Dubai_Logistics": (25.01, 55.06),
+    }
+
+# Node-level aggregates are computed once per dataset version, not per rerun
+_NODE_CACHE = {}
+_LOCK = threading.Lock()
+
+# =================================================================
+# 📍 NODE COORDINATES
+# =================================================================
+def node_coordinates(node_ids):
+    """
+    (lat, lon) arrays for node ids. Hubs use their anchor coordinates; any other
+    node is placed deterministically near a hub: the hub its name starts with
+    (e.g. "Port_Mumbai_Sat_0001"), otherwise one picked by hashing the name.
+    """
+    hubs = list(MapConfig.NODE_COORDINATES)
+    lats, lons = np.empty(len(node_ids)), np.empty(len(node_ids))
+    for i, node in enumerate(map(str, node_ids)):
+        if node in MapConfig.NODE_COORDINATES:
+            lats[i], lons[i] = MapConfig.NODE_COORDINATES[node]
+            continue
+        seed = int(hashlib.md5(node.encode()).hexdigest()[:8], 16)
+        hub = next((h for h in hubs if node.startswith(h + "_")), hubs[seed % len(hubs)])
+        offset = np.random.default_rng(seed).normal(0, MapConfig.SATELLITE_SPREAD, 2)
+        hub_lat, hub_lon = MapConfig.NODE_COORDINATES[hub]
+        lats[i] = np.clip(hub_lat + offset[0], -85, 85)
+        lons[i] = (hub_lon + offset[1] + 180) % 360 - 180
+    return lats, lons
+
+# =================================================================
+# 🛰️ NODE-LEVEL AGGREGATION
+# =================================================================
+def aggregate_node_risk(df):
+    """
+    Collapses telemetry to one row per node: lat, lon, mean lead time,
+    observation count and a risk index on a fixed scale (NOMINAL_RISK at the
+    baseline lead time), so nominal operations read low and shocks read high.
+    Uses `lat`/`lon` columns when the data carries them, otherwise
+    node_coordinates(). Returns None when the data has no mappable nodes.
+    """
+    if df is None or 'node_id' not in df.columns or 'lead_time' not in df.columns:
+        return None
+
+    cols = ['node_id', 'lead_time'] + [c for c in ('risk_score', 'lat', 'lon') if c in df.columns]
+    grouped = df[cols].groupby('node_id', observed=True)
+    nodes = grouped.agg(lead_time=('lead_time', 'mean'), observations=('lead_time', 'size'))
+
+    # Longer average lead time == more exposure, relative to the 14-day baseline
+    nodes['risk'] = MapConfig.NOMINAL_RISK * nodes['lead_time'] / MapConfig.BASELINE_LEAD_TIME
+    if 'risk_score' in df.columns:
+        nodes['risk_score'] = grouped['risk_score'].mean()
+
+    if 'lat' in df.columns and 'lon' in df.columns:
+        nodes['lat'] = grouped['lat'].mean()
+        nodes['lon'] = grouped['lon'].mean()
+    else:
+        nodes['lat'], nodes['lon'] = node_coordinates(nodes.index)
+
+    unmapped = nodes['lat'].isna().sum()
+    if unmapped:
+        logger.warning(f"{unmapped} nodes have no coordinates and were left off the map.")
+    nodes = nodes.dropna(subset=['lat', 'lon'])
+    if nodes.empty:
+        return None
+
+    return nodes.reset_index()
+
+def node_risk_for_version(df, version):
+    with _LOCK:
+        if version not in _NODE_CACHE:
+            _NODE_CACHE.clear()
+            _NODE_CACHE[version] = aggregate_node_risk(df)
+        return _NODE_CACHE[version]
+
+# =================================================================
+# 🗺️ ZOOM-DEPENDENT GRID BINNING
+# =================================================================
+def network_center(nodes):
+    """Observation-weighted centroid of the network as (lat, lon)."""
+    weights = nodes['observations'].to_numpy(dtype=float)
+    return float(np.average(nodes['lat'], weights=weights)), float(np.average(nodes['lon'], weights=weights))
+
+def nearest_node(nodes, center):
+    """(lat, lon) of the node closest to `center` (equirectangular distance)."""
+    d_lat = nodes['lat'].to_numpy() - center[0]
+    d_lon = ((nodes['lon'].to_numpy() - center[1] + 180) % 360 - 180) * np.cos(np.radians(center[0]))
+    i = int(np.argmin(d_lat ** 2 + d_lon ** 2))
+    return float(nodes['lat'].iloc[i]), float(nodes['lon'].iloc[i])
+
+def clip_to_viewport(nodes, zoom, center):
+    """Keeps nodes within VIEWPORT_TILES map tiles around `center` at this zoom."""
+    tile_deg = 360.0 / (2 ** zoom)
+    half_lon = tile_deg * MapConfig.VIEWPORT_TILES[0] / 2
+    half_lat = tile_deg * MapConfig.VIEWPORT_TILES[1] / 2
+    if half_lon >= 180 and half_lat >= 90:
+        return nodes
+    d_lon = (nodes['lon'] - center[1] + 180) % 360 - 180
+    return nodes[((nodes['lat'] - center[0]).abs() <= half_lat) & (d_lon.abs() <= half_lon)]
+
+def bin_nodes_for_zoom(nodes, zoom, center=None, max_points=MapConfig.MAX_POINTS):
+    """
+    Clips nodes to the viewport around `center` (default: network centroid),
+    then grid-bins them so each map tile shows at most CELLS_PER_TILE^2
+    markers. Each cell becomes one point at the observation-weighted
+    centroid, carrying the worst (max) node risk and risk_score and the number
+    of nodes it represents. The cell size doubles if the result would exceed
+    `max_points`.
+    """
+    if nodes is None or nodes.empty:
+        return nodes
+
+    columns = ['lat', 'lon', 'risk', 'lead_time', 'nodes'] + [c for c in ('risk_score',) if c in nodes.columns]
+    zoom = min(max(int(zoom), 0), 12)
+    nodes = clip_to_viewport(nodes, zoom, center or network_center(nodes))
+    if nodes.empty:
+        return nodes.assign(nodes=0)[columns]
+
+    cell_deg = 360.0 / (2 ** zoom) / MapConfig.CELLS_PER_TILE
+    lat, lon = nodes['lat'].to_numpy(), nodes['lon'].to_numpy()
+    weights = nodes['observations'].to_numpy(dtype=float)
+
+    while True:
+        cell_keys = np.floor(lat / cell_deg).astype(np.int64) * 100000 + np.floor(lon / cell_deg).astype(np.int64)
+        codes, inverse = np.unique(cell_keys, return_inverse=True)
+        if len(codes) <= max_points:
+            break
+        cell_deg *= 2
+
+    if len(codes) == len(nodes):
+        # Every node already sits in its own cell: nothing to merge
+        return nodes.assign(nodes=1)[columns]
+
+    n_cells = len(codes)
+    weight_sum = np.bincount(inverse, weights=weights, minlength=n_cells)
+    lead_sum = np.bincount(inverse, weights=nodes['lead_time'].to_numpy() * weights, minlength=n_cells)
+    cells = pd.DataFrame({
+        'lat': np.bincount(inverse, weights=lat * weights, minlength=n_cells) / weight_sum,
+        'lon': np.bincount(inverse, weights=lon * weights, minlength=n_cells) / weight_sum,
+        'lead_time': lead_sum / weight_sum,
+        'nodes': np.bincount(inverse, minlength=n_cells)
+    })
+    for col in ('risk', 'risk_score'):
+        if col in nodes.columns:
+            # Cell keeps its worst node; fmax skips nodes with no score
+            worst = np.full(n_cells, np.nan)
+            np.fmax.at(worst, inverse, nodes[col].to_numpy(dtype=float))
+            cells[col] = worst
+    return cells[columns]
+
+def build_map_points(df, version, zoom, shock_factor=1.0, center=None):
+    """
+    Downsampled, shock-adjusted map points plus the (lat, lon) map centre
+    for the dashboard, or None if the data is not mappable. If no node is in
+    view around `center`, the map re-centres on the nearest node.
+    """
+    nodes = node_risk_for_version(df, version)
+    if nodes is None:
+        return None
+    center = center or network_center(nodes)
+    if clip_to_viewport(nodes, min(max(int(zoom), 0), 12), center).empty:
+        # e.g. the centroid of a few far-apart hubs lies at sea at high zoom
+        center = nearest_node(nodes, center)
+    points = bin_nodes_for_zoom(nodes, zoom, center)
+    # Systemic shocks amplify exposure across the whole network
+    return points.assign(risk=np.clip(points['risk'] * shock_factor, 1, 100).round(1)), center
@@ -0,0 +1,248 @@
+import asyncio
+import os
+import sys
+
+import numpy as np
+from aiohttp import web
+from dotenv import load_dotenv
+
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.utils import setup_custom_logger
+from src.ml_model import FEATURES, train_restock_predictor, score_restock_batch
+from src.dataset_cache import load_dataset
+from src.sovereign_kernel import (
+    SovereignKernel, OPTIMIZATION_ALPHA, SCENARIO_WEIGHTS, ENTROPY_LEVELS
+)
+
+load_dotenv()
+logger = setup_custom_logger("ScoringService")
+
+class ServiceConfig:
+    HOST = os.getenv('SCORING_HOST', '127.0.0.1')
+    PORT = int(os.getenv('SCORING_PORT', 8080))
+    DATA_FILE = os.getenv('SCORING_DATA_FILE', os.path.join('data', 'processed_data.csv'))
+    MAX_BATCH_SIZE = int(os.getenv('SCORING_MAX_BATCH_SIZE', 256))
+    MAX_WAIT_MS = float(os.getenv('SCORING_MAX_WAIT_MS', 5))
+
+# =================================================================
+# ⚡ MICRO-BATCHER
+# =================================================================
+class MicroBatcher:
+    """
+    Coalesces concurrent single-item requests into one vectorized call.
+    A batch is flushed once it holds `max_batch_size` items or `max_wait_ms`
+    has elapsed since its first item arrived, whichever comes first.
+    """
+
+    def __init__(self, name, batch_fn, max_batch_size, max_wait_ms):
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, item):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # Drain whatever is already queued before waiting on the clock
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+            try:
+                # CPU-bound scoring runs off the event loop
+                results = await loop.run_in_executor(None, self.batch_fn, items)
+            except Exception as e:
+                logger.error(f"[{self.name}] Batch of {len(items)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+            if len(results) < len(batch):
+                error = RuntimeError(f"[{self.name}] batch_fn returned {len(results)} results for {len(batch)} items")
+                logger.error(str(error))
+                for _, future in batch[len(results):]:
+                    if not future.done():
+                        future.set_exception(error)
+
+# =================================================================
+# 🧮 VECTORIZED BATCH FUNCTIONS
+# =================================================================
+def score_var_batch(items):
+    """Single vectorized compute_var call for a batch of (entropy, shock) pairs."""
+    entropy = np.array([i['entropy'] for i in items], dtype=float)
+    shock = np.array([i['shock_factor'] for i in items], dtype=float)
+    raw_var = np.atleast_1d(SovereignKernel.compute_var(entropy, shock))
+    optimized_var = raw_var + np.abs(raw_var) * OPTIMIZATION_ALPHA
+    return [
+        {'entropy': float(e), 'shock_factor': float(s), 'var': float(v), 'optimized_var': float(o)}
+        for e, s, v, o in zip(entropy, shock, raw_var, optimized_var)
+    ]
+
+# Validation happens per request, before anything joins a shared batch,
+# so one malformed payload can never fail the requests batched with it.
+def _require_dict(payload):
+    if not isinstance(payload, dict):
+        raise web.HTTPBadRequest(reason="Expected a JSON object")
+    return payload
+
+def _parse_float(payload, field):
+    try:
+        value = float(payload[field])
+    except (TypeError, ValueError):
+        raise web.HTTPBadRequest(reason=f"Field '{field}' must be numeric, got {payload[field]!r}")
+    if not np.isfinite(value):
+        raise web.HTTPBadRequest(reason=f"Field '{field}' must be finite, got {payload[field]!r}")
+    return value
+
+def _parse_entropy(payload):
+    _require_dict(payload)
+    if 'entropy' in payload:
+        return _parse_float(payload, 'entropy')
+    level = payload.get('entropy_level', 'Stable')
+    if not isinstance(level, str) or level not in ENTROPY_LEVELS:
+        raise web.HTTPBadRequest(reason=f"Unknown entropy_level {level!r}. Expected one of {list(ENTROPY_LEVELS)}")
+    return ENTROPY_LEVELS[level]
+
+def _parse_restock_record(record):
+    _require_dict(record)
+    missing = [f for f in FEATURES if f not in record]
+    if missing:
+        raise web.HTTPBadRequest(reason=f"Missing features: {missing}")
+    return {f: _parse_float(record, f) for f in FEATURES}
+
+async def _read_json(request):
+    try:
+        return await request.json()
+    except Exception:
+        raise web.HTTPBadRequest(reason="Request body must be valid JSON")
+
+# =================================================================
+# 🌐 HTTP HANDLERS
+# =================================================================
+async def health(request):
+    app = request.app
+    return web.json_response({
+        'status': 'OPERATIONAL',
+        'records_loaded': app['records_loaded'],
+        'max_batch_size': ServiceConfig.MAX_BATCH_SIZE,
+        'max_wait_ms': ServiceConfig.MAX_WAIT_MS
+    })
+
+async def predict_restock(request):
+    """Accepts a single record or {"records": [...]}; each record joins the shared micro-batch."""
+    payload = await _read_json(request)
+    records = payload.get('records', [payload]) if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not records:
+        raise web.HTTPBadRequest(reason="Expected a record or a non-empty list of records")
+    parsed = [_parse_restock_record(r) for r in records]
+    results = await asyncio.gather(*(request.app['restock_batcher'].submit(r) for r in parsed))
+    if isinstance(payload, dict) and 'records' not in payload:
+        return web.json_response(results[0])
+    return web.json_response({'predictions': results})
+
+async def compute_var(request):
+    payload = _require_dict(await _read_json(request))
+    scenario = payload.get('scenario')
+    if scenario is not None and (not isinstance(scenario, str) or scenario not in SCENARIO_WEIGHTS):
+        raise web.HTTPBadRequest(reason=f"Unknown scenario {scenario!r}. Expected one of {list(SCENARIO_WEIGHTS)}")
+    if scenario:
+        shock = SCENARIO_WEIGHTS[scenario]
+    elif 'shock_factor' in payload:
+        shock = _parse_float(payload, 'shock_factor')
+    else:
+        shock = 1.0
+    item = {'entropy': _parse_entropy(payload), 'shock_factor': shock}
+    return web.json_response(await request.app['var_batcher'].submit(item))
+
+async def stress_test(request):
+    """VaR under every stress scenario for the requested entropy level."""
+    payload = await _read_json(request)
+    entropy = _parse_entropy(payload)
+    batcher = request.app['var_batcher']
+    results = await asyncio.gather(*(
+        batcher.submit({'entropy': entropy, 'shock_factor': weight}) for weight in SCENARIO_WEIGHTS.values()
+    ))
+    return web.json_response({'scenarios': dict(zip(SCENARIO_WEIGHTS, results))})
+
+# =================================================================
+# 🚀 APPLICATION LIFECYCLE
+# =================================================================
+async def on_startup(app):
+    # Model and dataset are loaded exactly once per process
+    logger.info(f"Loading dataset from {ServiceConfig.DATA_FILE}...")
+    df = load_dataset(ServiceConfig.DATA_FILE)
+    missing = [c for c in FEATURES + ['restock_needed'] if c not in df.columns]
+    if missing:
+        # run_pipeline.py writes node telemetry without the order-level restock features
+        raise RuntimeError(
+            f"{ServiceConfig.DATA_FILE} has no restock features {missing}. "
+            f"Run src/generate_data.py and src/data_engine.py, or point SCORING_DATA_FILE "
+            f"at an order-level dataset with columns {FEATURES + ['restock_needed']}."
+        )
+    model = train_restock_predictor(df)
+    app['records_loaded'] = len(df)
+    app['restock_batcher'] = MicroBatcher(
+        "restock", lambda items: score_restock_batch(model, items),
+        ServiceConfig.MAX_BATCH_SIZE, ServiceConfig.MAX_WAIT_MS
+    )
+    app['var_batcher'] = MicroBatcher(
+        "var", score_var_batch, ServiceConfig.MAX_BATCH_SIZE, ServiceConfig.MAX_WAIT_MS
+    )
+    app['restock_batcher'].start()
+    app['var_batcher'].start()
+    logger.info(f"Scoring service ready: {len(df)} records, batch<={ServiceConfig.MAX_BATCH_SIZE}, wait<={ServiceConfig.MAX_WAIT_MS}ms")
+
+async def on_cleanup(app):
+    await app['restock_batcher'].stop()
+    await app['var_batcher'].stop()
+
+def create_app():
+    app = web.Application()
+    app.router.add_get('/health', health)
+    app.router.add_post('/predict/restock', predict_restock)
+    app.router.add_post('/risk/var', compute_var)
+    app.router.add_post('/risk/stress', stress_test)
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+if __name__ == "__main__":
+    print(f"\n>>> [SCORING SERVICE] Listening on http://{ServiceConfig.HOST}:{ServiceConfig.PORT}")
+    web.run_app(create_app(), host=ServiceConfig.HOST, port=ServiceConfig.PORT)
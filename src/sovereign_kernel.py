@@ -0,0 +1,35 @@
+import numpy as np
+from scipy.stats import norm
+
+# =================================================================
+# 🧬 SOVEREIGN KERNEL (QUANTITATIVE ENGINE)
+# Shared by the Streamlit dashboard (app.py) and the scoring service.
+# =================================================================
+OPTIMIZATION_ALPHA = 0.1425
+CONFIDENCE_LEVEL = 0.99
+BASE_REVENUE = 150000000
+
+SCENARIO_WEIGHTS = {"Nominal Operations": 1.0, "Suez Canal Blockade": 2.8, "Tier-1 Cyber Attack": 4.2, "Regional Conflict": 7.0}
+ENTROPY_LEVELS = {"Stable": 0.05, "Unstable": 0.15, "Chaotic": 0.40}
+
+class SovereignKernel:
+    """The mathematical heart of the system."""
+    @staticmethod
+    def calculate_pareto_front(profits, sustainability):
+        points = np.vstack((profits, sustainability)).T
+        pareto_front = []
+        for i, p in enumerate(points):
+            if not any((points[:, 0] >= p[0]) & (points[:, 1] >= p[1]) & (np.arange(len(points)) != i)):
+                pareto_front.append(p)
+        return np.array(sorted(pareto_front, key=lambda x: x[0]))
+
+    @staticmethod
+    def compute_var(entropy_val, shock_factor=1.0):
+        # Works on scalars and on NumPy arrays (vectorized batch scoring)
+        mu = BASE_REVENUE
+        sigma = mu * np.asarray(entropy_val) * np.asarray(shock_factor)
+        return mu + (norm.ppf(1 - CONFIDENCE_LEVEL) * sigma)
+
+    @staticmethod
+    def generate_risk_matrix():
+        return np.random.randint(1, 10, size=(5, 5))
@@ -1,8 +1,14 @@
 import pandas as pd
 import numpy as np
+import os
+import sys
+
+# Ensure utility modules are discoverable
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.dataset_cache import load_dataset
 
 def run_scenario_simulation():
-    df = pd.read_csv('data/processed_data.csv')
+    df = load_dataset()
     
     print("\n" + "="*40)
     print("🚩 SCENARIO: 50% SUPPLY CHAIN DISRUPTION")
@@ -22,4 +28,4 @@ def run_scenario_simulation():
     print("="*40)
 
 if __name__ == "__main__":
-    run_scenario_simulation()
\ No newline at end of file
+    run_scenario_simulation()
\ No newline at end of file